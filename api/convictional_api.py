@@ -29,6 +29,7 @@ def fetch_convictional_orders(start_date, end_date, flagged_filter):
     }
 
     all_orders_data = []
+    error = None
     next_page_url = base_url
     page_num = 1
     has_more = True
@@ -42,6 +43,8 @@ def fetch_convictional_orders(start_date, end_date, flagged_filter):
             json_data = response.json()
 
             if 'error' in json_data and json_data['error']:
+                error = f"Convictional API returned an error: {json_data['error']}"
+                logging.error(error)
                 break
 
             orders = json_data.get('data', {}).get('orders', [])
@@ -63,17 +66,21 @@ def fetch_convictional_orders(start_date, end_date, flagged_filter):
                 logging.info('no more pages found')
 
         except requests.exceptions.HTTPError as e:
-            logging.error(f"HTTP Error fetching Convictional orders: {e.response.status_code} - {e.response.text}")
+            error = f"HTTP Error fetching Convictional orders: {e.response.status_code} - {e.response.text}"
+            logging.error(error)
             break # Stop on HTTP error
         except requests.exceptions.RequestException as e:
-            logging.error(f"Request Exception fetching Convictional orders: {e}")
+            error = f"Request Exception fetching Convictional orders: {e}"
+            logging.error(error)
             break # Stop on connection error
         except ValueError:
-            logging.error(f"Failed to decode JSON response from Convictional API. Status: {response.status_code}, Content: {response.text}")
+            error = f"Failed to decode JSON response from Convictional API. Status: {response.status_code}, Content: {response.text}"
+            logging.error(error)
             break
         except Exception as e:
-            logging.error(f"An unexpected error occurred during Convictional fetch: {e}")
+            error = f"An unexpected error occurred during Convictional fetch: {e}"
+            logging.error(error)
             break
     
     logging.info(f"Total Convictional orders fetched (Flagged={flagged_filter}): {len(all_orders_data)}")
-    return all_orders_data
\ No newline at end of file
+    return all_orders_data, error
\ No newline at end of file
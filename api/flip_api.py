@@ -1,7 +1,9 @@
 import requests
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from utils.flip_auth import get_flip_access_token
+from utils.adaptive_limiter import AdaptiveLimiter
 from dotenv import load_dotenv
 import os
 
@@ -17,6 +19,25 @@ FLIP_CANCEL_ORDERS_PATH = '/shop/admin/orders/{order_id}/cancel/v1'
 X_FLIPINATOR_TOOLS = os.getenv('X_FLIPINATOR_TOOLS')
 MAX_RETRIES_FLIP = int(os.getenv('MAX_RETRIES_FLIP', 1))
 
+# per-process in-flight limit for Flip calls, adjusted from observed latency and 429/5xx rates;
+# under run_tenants.py every tenant process has its own, so the FLIP_CONCURRENCY_* bounds apply per tenant
+FLIP_LIMITER = AdaptiveLimiter(
+    'Flip API',
+    initial_limit=int(os.getenv('FLIP_CONCURRENCY_INITIAL', 4)),
+    min_limit=int(os.getenv('FLIP_CONCURRENCY_MIN', 1)),
+    max_limit=int(os.getenv('FLIP_CONCURRENCY_MAX', 16)),
+    latency_target=float(os.getenv('FLIP_LATENCY_TARGET_MS', 1000)) / 1000,
+)
+
+def get_flip_limiter_metrics():
+    return FLIP_LIMITER.get_metrics()
+
+def map_flip_calls(fn, items):
+    """Runs fn over items on a thread pool and returns the results in order.
+    The pool is sized to the limiter's max; FLIP_LIMITER decides how many Flip calls are actually in flight."""
+    with ThreadPoolExecutor(max_workers=FLIP_LIMITER.max_limit) as executor:
+        return list(executor.map(fn, items))
+
 def get_order_status_from_flip(order_id, limit=250):
     if not FLIP_BASE_URL or not FLIP_ORDERS_PATH:
         logging.error("Flip API URL or Path not configured")
@@ -44,7 +65,9 @@ def get_order_status_from_flip(order_id, limit=250):
 
         try:
             logging.debug(f"Attempt {attempt+1}: Calling Flip API: GET {url} with params {params}")
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            with FLIP_LIMITER.slot() as call:
+                response = requests.get(url, headers=headers, params=params, timeout=30)
+                call.status_code = response.status_code
             last_status_code = response.status_code
             logging.debug(f"Flip API Response Status: {last_status_code}")
 
@@ -97,15 +120,19 @@ def disable_sku(sku, audit_status, token):
 
     try:
         disable_skus_url = f'{FLIP_BASE_URL}{FLIP_DISABLE_SKUS_PATH}'
-        response = requests.put(disable_skus_url, headers=headers, json=payload)
+        with FLIP_LIMITER.slot() as call:
+            response = requests.put(disable_skus_url, headers=headers, json=payload, timeout=30)
+            call.status_code = response.status_code
         response.raise_for_status()
         resp_data = response.json()
         logger.info(f"Disabled SKU {sku} with auditStatus '{audit_status}': {resp_data}")
+        return True
     except requests.exceptions.RequestException as e:
         logger.error(f"Failed to disable SKU {sku}: {e}")
         if hasattr(e, 'response') and e.response is not None:
             logger.error(f"Response status code: {e.response.status_code}")
             logger.error(f"Response content: {e.response.text}")
+    return False
 
 def lookup_order(buyer_order_code, token):
     params = {"page": 1, "limit": 10, "customerOrderId": buyer_order_code}
@@ -118,7 +145,9 @@ def lookup_order(buyer_order_code, token):
     try:
         logger.info(f"Looking up order for buyer_order_code: {buyer_order_code}")
         flip_orders_url = f'{FLIP_BASE_URL}{FLIP_ORDERS_PATH}'
-        response = requests.get(flip_orders_url, headers=headers, params=params)
+        with FLIP_LIMITER.slot() as call:
+            response = requests.get(flip_orders_url, headers=headers, params=params, timeout=30)
+            call.status_code = response.status_code
         response.raise_for_status()
         data = response.json()
         orders = data.get("data", [])
@@ -152,15 +181,19 @@ def cancel_order(order_id, token):
     
     try:
         logger.info(f"Attempting to cancel order id {order_id}")
-        response = requests.post(url, headers=headers, json=payload)
+        with FLIP_LIMITER.slot() as call:
+            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            call.status_code = response.status_code
         response.raise_for_status()
         data = response.json()
         result = data.get("data", {}).get("result")
         if result == "success":
             logger.info(f"Successfully cancelled order {order_id}")
+            return True
         else:
             logger.error(f"Cancellation failed for order {order_id}. Response: {data}")
     except requests.exceptions.RequestException as e:
         logger.error(f"Error cancelling order {order_id}: {e}")
         if hasattr(e, 'response') and e.response is not None:
-            logger.error(f"Status Code: {e.response.status_code} | Response: {e.response.text}")
\ No newline at end of file
+            logger.error(f"Status Code: {e.response.status_code} | Response: {e.response.text}")
+    return False
@@ -1,6 +1,6 @@
 import pandas as pd
 import logging
-from api.flip_api import lookup_order, cancel_order
+from api.flip_api import lookup_order, cancel_order, map_flip_calls
 from utils.flip_auth import get_flip_access_token
 from dotenv import load_dotenv
 
@@ -9,19 +9,30 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+def lookup_and_cancel_order(buyer_order_code, token):
+    order_id = lookup_order(buyer_order_code, token)
+    if order_id:
+        return 'cancelled' if cancel_order(order_id, token) else 'failed'
+    logger.error(f"Skipping cancellation because no order id was found for buyer_order_code: {buyer_order_code}")
+    return 'not_found'
+
 def process_and_cancel_orders_from_csv(csv_file):
+    result = {'orders': 0, 'cancelled': 0, 'not_found': 0, 'failed': 0, 'error': None}
     token = get_flip_access_token()
     if not token:
         logger.error("Failed to retrieve access token. Exiting.")
-        return
+        result['error'] = "Could not get Flip access token"
+        return result
 
     try:
         df = pd.read_csv(csv_file)
         logger.info(f"Read {len(df)} rows from {csv_file}")
     except Exception as e:
         logger.error(f"Failed to read {csv_file}: {e}")
-        return
+        result['error'] = f"Could not read {csv_file}: {e}"
+        return result
 
+    buyer_order_codes = []
     for index, row in df.iterrows():
         flagged_message = str(row.get("flagged_message", "")).lower().strip()
         #only proceed if flagged_message contains one of the flagged messages
@@ -35,11 +46,13 @@ def process_and_cancel_orders_from_csv(csv_file):
             logger.error(f"No buyer_order_code found in row {index}. Skipping...")
             continue
 
-        order_id = lookup_order(buyer_order_code, token)
-        if order_id:
-            cancel_order(order_id, token)
-        else:
-            logger.error(f"Skipping cancellation because no order id was found for buyer_order_code: {buyer_order_code}")
+        buyer_order_codes.append(buyer_order_code)
+
+    outcomes = map_flip_calls(lambda code: lookup_and_cancel_order(code, token), buyer_order_codes)
+    result['orders'] = len(buyer_order_codes)
+    for outcome in outcomes:
+        result[outcome] += 1
+    return result
 
 if __name__ == "__main__":
     process_and_cancel_orders_from_csv("flagged_orders.csv")
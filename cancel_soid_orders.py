@@ -1,5 +1,6 @@
+import os
 import logging
-from api.flip_api import lookup_order, cancel_order
+from api.flip_api import lookup_order, cancel_order, map_flip_calls
 from utils.flip_auth import get_flip_access_token
 from utils.looker_utils import looker_credentials, get_look_data
 from dotenv import load_dotenv
@@ -9,13 +10,32 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(name)s: %(message)s')
 
-LOOK_ID = '851'
+LOOK_ID = os.getenv('SOID_LOOK_ID', '851')
+
+def lookup_and_cancel_soid_order(code, token):
+    logger.info(f"Processing buyer order code: {code}")
+    try:
+        flip_order_id = lookup_order(code, token)
+        if flip_order_id:
+            logger.info(f"Found Flip Order ID '{flip_order_id}' for buyer order code '{code}'. Initiating cancellation...")
+            return 'cancelled' if cancel_order(flip_order_id, token) else 'failed'
+        logger.warning(f"Lookup failed: No Flip Order ID found for buyer order code '{code}'.")
+        return 'not_found'
+    except Exception as error:
+        logger.error(f"Error processing buyer order code '{code}': {error}")
+        return 'failed'
 
 def fetch_and_cancel_soid_orders():
     logger.info("Starting process to fetch and cancel SOID orders from Looker and Flip API.")
+    result = {'orders': 0, 'cancelled': 0, 'not_found': 0, 'failed': 0, 'error': None}
 
-    sdk_instance = looker_credentials()
-    look_data = get_look_data(sdk_instance, LOOK_ID)
+    try:
+        sdk_instance = looker_credentials()
+        look_data = get_look_data(sdk_instance, LOOK_ID)
+    except Exception as error:
+        logger.error(f"Failed to fetch SOID orders from Looker: {error}")
+        result['error'] = f"Could not fetch Look {LOOK_ID} from Looker: {error}"
+        return result
 
     #extract buyer order codes
     buyer_order_codes = [entry.get("flip_orders_all.orderid") for entry in look_data]
@@ -26,26 +46,22 @@ def fetch_and_cancel_soid_orders():
         logger.info("Successfully obtained Flip access token.")
     else:
         logger.error("Failed to obtain Flip access token.")
-        raise ValueError("Token could not be retrieved.")
+        result['error'] = "Could not get Flip access token"
+        return result
+
+    empty_codes = sum(1 for code in buyer_order_codes if not code)
+    if empty_codes:
+        logger.warning(f"Encountered {empty_codes} empty or None buyer order codes, skipping.")
+    buyer_order_codes = [code for code in buyer_order_codes if code]
 
     # process each buyer order code
-    for code in buyer_order_codes:
-        if not code:
-            logger.warning("Encountered an empty or None buyer order code, skipping.")
-            continue
-
-        logger.info(f"Processing buyer order code: {code}")
-        try:
-            flip_order_id = lookup_order(code, token)
-            if flip_order_id:
-                logger.info(f"Found Flip Order ID '{flip_order_id}' for buyer order code '{code}'. Initiating cancellation...")
-                cancel_order(flip_order_id, token)
-            else:
-                logger.warning(f"Lookup failed: No Flip Order ID found for buyer order code '{code}'.")
-        except Exception as error:
-            logger.error(f"Error processing buyer order code '{code}': {error}")
+    outcomes = map_flip_calls(lambda code: lookup_and_cancel_soid_order(code, token), buyer_order_codes)
 
+    result['orders'] = len(buyer_order_codes)
+    for outcome in outcomes:
+        result[outcome] += 1
     logger.info("SOID order processing completed.")
+    return result
 
 if __name__ == "__main__":
     fetch_and_cancel_soid_orders()
@@ -1,7 +1,7 @@
 import pandas as pd
 import logging
 from utils.flip_auth import get_flip_access_token
-from api.flip_api import disable_sku
+from api.flip_api import disable_sku, map_flip_calls
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -19,15 +19,19 @@ def read_flagged_orders(file_path):
         return None
 
 def disable_all_flagged_skus(file_path):
+    result = {'skus': 0, 'disabled': 0, 'failed': 0, 'error': None}
     token = get_flip_access_token()
     if not token:
         logger.error("Could not get access token. Exiting...")
-        return
+        result['error'] = "Could not get Flip access token"
+        return result
 
     df = read_flagged_orders(file_path)
     if df is None:
-        return
+        result['error'] = f"Could not read {file_path}"
+        return result
 
+    sku_jobs = []
     for _, row in df.iterrows():
         flagged_message = str(row['flagged_message']).strip().lower()
         buyer_item_codes = str(row['buyer_item_codes']).strip()
@@ -43,9 +47,15 @@ def disable_all_flagged_skus(file_path):
                 # update audit_status if flagged_message contains correct error message
                 if "cannot be a variant with components" in flagged_message:
                     audit_status = "unsupportedBundle"
-                disable_sku(sku, audit_status, token)
+                sku_jobs.append((sku, audit_status))
         else:
             logger.info("Skipping row since flagged_message does not meet disable criteria.")
 
+    disabled = map_flip_calls(lambda job: disable_sku(*job, token), sku_jobs)
+    result['skus'] = len(sku_jobs)
+    result['disabled'] = sum(disabled)
+    result['failed'] = len(sku_jobs) - result['disabled']
+    return result
+
 if __name__ == "__main__":
     disable_all_flagged_skus("flagged_orders.csv")
@@ -3,31 +3,49 @@ from process_flagged_orders import fetch_and_process_flagged_orders
 from disable_skus import disable_all_flagged_skus
 from cancel_flagged_orders import process_and_cancel_orders_from_csv
 from cancel_soid_orders import fetch_and_cancel_soid_orders
+from api.flip_api import get_flip_limiter_metrics
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 FLAGGED_ORDERS_CSV = "flagged_orders.csv"
 
-def main():
+def main(flagged_orders_csv=FLAGGED_ORDERS_CSV):
+    """Runs all pipeline steps and returns each step's counts and error, keyed by step."""
     logging.info("=== Starting order and sku disablement pipeline ===")
+    steps = {}
     
     # 1. Process flagged orders from Convictional and save to CSV
     logging.info("Step 1: Fetch and check flagged orders from Convictional.")
-    fetch_and_process_flagged_orders()
+    steps['flagged_orders'] = fetch_and_process_flagged_orders(flagged_orders_csv)
     
     # 2. Disable SKUs for flagged orders
     logging.info("Step 2: Disabling SKUs based on flagged order message")
-    disable_all_flagged_skus(FLAGGED_ORDERS_CSV)
+    steps['disable_skus'] = disable_all_flagged_skus(flagged_orders_csv)
     
     # 3. Lookup orders in Flip and cancel them
     logging.info("Step 3: Cancelling orders based on flagged orders message")
-    process_and_cancel_orders_from_csv(FLAGGED_ORDERS_CSV)
+    steps['cancel_flagged_orders'] = process_and_cancel_orders_from_csv(flagged_orders_csv)
 
     # Step 4: Lookup and cancel missing SOID orders
     logging.info("Step 4: Cancelling orders missing seller order ID")
-    fetch_and_cancel_soid_orders()
+    steps['cancel_soid_orders'] = fetch_and_cancel_soid_orders()
+
+    for step, result in steps.items():
+        if result['error']:
+            logging.error(f"{step} failed: {result['error']}")
+        elif result['failed']:
+            logging.warning(f"{step}: {result['failed']} item(s) failed")
+
+    metrics = get_flip_limiter_metrics()
+    logging.info(
+        f"Flip concurrency: limit {metrics['limit']} (peak in flight {metrics['peak_in_flight']}), "
+        f"{metrics['calls']} calls, avg latency {metrics['avg_latency']}s, "
+        f"{metrics['throttled']} throttled, {metrics['server_errors']} server errors, "
+        f"{metrics['increases']} increases / {metrics['decreases']} decreases"
+    )
     
     logging.info("=== Full processing pipeline completed. ===")
+    return steps
 
 if __name__ == "__main__":
     main()
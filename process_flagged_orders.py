@@ -1,6 +1,6 @@
 from utils.common_utils import get_today_date, get_yesterday_date
 from api.convictional_api import fetch_convictional_orders
-from api.flip_api import get_order_status_from_flip
+from api.flip_api import get_order_status_from_flip, map_flip_calls
 import logging
 import csv
 import os
@@ -14,11 +14,7 @@ FLAGGED_ORDERS_CSV = 'flagged_orders.csv'
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(filename)s - %(message)s')
 
 def write_to_csv(filepath, data_rows, header):
-    """Overwrites CSV file with new data, not keeping historical entries."""
-    if not data_rows:
-        logging.debug(f"No data provided to write to {filepath}")
-        return
-    
+    """Overwrites CSV file with new data, not keeping historical entries. Empty data leaves a header-only file."""
     try:
         directory = os.path.dirname(filepath)
         if directory:
@@ -35,23 +31,36 @@ def write_to_csv(filepath, data_rows, header):
     except Exception as e:
         logging.error(f"An unexpected error occurred during CSV writing: {e}")
 
-def fetch_and_process_flagged_orders():
-    """Fetches flagged orders, gets Flip status, filters, and saves to CSV."""
+def fetch_and_process_flagged_orders(csv_path=FLAGGED_ORDERS_CSV):
+    """Fetches flagged orders, gets Flip status, filters, and saves to CSV. Returns counts and any fetch error."""
     logging.info("--- Starting processing of FLAGGED orders ---")
+    result = {'fetched': 0, 'flagged': 0, 'failed': 0, 'error': None}
+    header = ["convictional_order_id", "flagged_message", "buyer_order_code", "flip_order_state", "buyer_item_codes"]
+
+    # never let later steps act on a previous run's orders
+    if os.path.exists(csv_path):
+        os.remove(csv_path)
+        logging.info(f"Removed previous {csv_path}")
+
     # set date range
     start_date = get_yesterday_date()
     end_date = get_today_date()
     logging.info(f"Using date range: {start_date} to {end_date}")
 
     # fetch flagged orders from Convictional
-    convictional_orders = fetch_convictional_orders(start_date, end_date, flagged_filter=True)
+    convictional_orders, result['error'] = fetch_convictional_orders(start_date, end_date, flagged_filter=True)
+    result['fetched'] = len(convictional_orders)
     if not convictional_orders:
         logging.info("No flagged orders fetched from Convictional for this date range.")
+        write_to_csv(csv_path, [], header)
         logging.info("--- Finished processing FLAGGED orders ---")
-        return
+        return result
 
     processed_orders = []
-    header = ["convictional_order_id", "flagged_message", "buyer_order_code", "flip_order_state", "buyer_item_codes"]
+
+    buyer_order_codes = list(dict.fromkeys(order.get("buyerOrderCode") for order in convictional_orders if order.get("buyerOrderCode")))
+    logging.info(f"Getting Flip status for {len(buyer_order_codes)} buyer order codes...")
+    flip_results = dict(zip(buyer_order_codes, map_flip_calls(get_order_status_from_flip, buyer_order_codes)))
 
     for order in convictional_orders:
         conv_order_id = order.get("_id")
@@ -64,8 +73,9 @@ def fetch_and_process_flagged_orders():
             logging.warning(f"Skipping Convictional Order {conv_order_id}: Missing 'buyerOrderCode'.")
             continue
 
-        logging.info(f"Getting Flip status for Convictional Order {conv_order_id} (Buyer Code: {buyer_order_code})...")
-        flip_data, status_code = get_order_status_from_flip(buyer_order_code)
+        flip_data, status_code = flip_results[buyer_order_code]
+        if flip_data is None:
+            result['failed'] += 1
 
         # process based on Flip API result
         flip_order_state = "Error or Not Found"  #default status
@@ -94,14 +104,12 @@ def fetch_and_process_flagged_orders():
         else:
             logging.info(f"Order {conv_order_id} skipped. Flip state '{flip_order_state}' != '{ALLOWED_FLIP_STATE}'.")
 
-    if processed_orders:
-        write_to_csv(FLAGGED_ORDERS_CSV, processed_orders, header)
-    else:
+    if not processed_orders:
         logging.info("No flagged orders met the required Flip state criteria.")
-        if os.path.exists(FLAGGED_ORDERS_CSV):
-            write_to_csv(FLAGGED_ORDERS_CSV, [], header)
-            logging.info(f"Cleared existing data in {FLAGGED_ORDERS_CSV}")
+    write_to_csv(csv_path, processed_orders, header)
+    result['flagged'] = len(processed_orders)
     logging.info("--- Finished processing FLAGGED orders ---")
+    return result
 
 if __name__ == "__main__":
     fetch_and_process_flagged_orders()
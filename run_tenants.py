@@ -0,0 +1,214 @@
+import os
+import re
+import json
+import time
+import logging
+import traceback
+import multiprocessing
+import multiprocessing.connection
+from datetime import datetime
+
+# NOTE: pipeline modules (main, api.*, utils.*) read their credentials from env vars at
+# import time, so they must only be imported inside the worker after the tenant env is set.
+# The Flip concurrency limiter (FLIP_CONCURRENCY_*) is per tenant process and doesn't see the other
+# tenants' load: total Flip concurrency can reach TENANT_WORKERS x FLIP_CONCURRENCY_MAX.
+
+TENANTS_CONFIG = os.getenv('TENANTS_CONFIG', 'tenants.json')
+TENANTS_WORK_DIR = os.getenv('TENANTS_WORK_DIR', 'tenants')
+TENANT_REPORT_JSON = os.getenv('TENANT_REPORT_JSON', 'tenant_report.json')
+TENANT_WORKERS = int(os.getenv('TENANT_WORKERS', os.cpu_count() or 1))
+FLAGGED_ORDERS_CSV = 'flagged_orders.csv'
+TENANT_NAME_PATTERN = re.compile(r'[A-Za-z0-9_-]+')
+
+# account-specific settings every tenant must set itself; falling back to the shared .env
+# for any of these would act on the default seller's orders and SKUs
+REQUIRED_TENANT_KEYS = (
+    'CONVICTIONAL_API_TOKEN',
+    'REFRESH_TOKEN',
+    'FLIP_BASE_URL',
+    'X_FLIPINATOR_TOOLS',
+    'SOID_LOOK_ID',
+    'LOOKERSDK_BASE_URL',
+    'LOOKERSDK_CLIENT_ID',
+    'LOOKERSDK_CLIENT_SECRET',
+)
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+def load_tenants(config_path):
+    """Reads the tenant list from a JSON config file. env_file paths are resolved relative to the config file."""
+    with open(config_path, encoding='utf-8') as f:
+        config = json.load(f)
+
+    tenants = config.get('tenants', [])
+    config_dir = os.path.dirname(os.path.abspath(config_path))
+    seen = set()
+    for tenant in tenants:
+        name = tenant.get('name')
+        if not name:
+            raise ValueError(f"Tenant entry without a 'name' in {config_path}: {tenant}")
+        if not TENANT_NAME_PATTERN.fullmatch(name):
+            raise ValueError(f"Invalid tenant name '{name}' in {config_path}: use only letters, digits, '_' and '-'")
+        if name in seen:
+            raise ValueError(f"Duplicate tenant name '{name}' in {config_path}")
+        seen.add(name)
+        if tenant.get('env_file'):
+            tenant['env_file'] = os.path.join(config_dir, tenant['env_file'])
+    return tenants
+
+def run_tenant(tenant):
+    """Runs the full pipeline for one tenant. Executes in its own fresh worker process."""
+    name = tenant['name']
+    started = time.monotonic()
+    outcome = {'tenant': name, 'pid': os.getpid(), 'status': 'failed', 'error': None}
+    logging.basicConfig(
+        level=logging.INFO,
+        format=f'%(asctime)s - {name} - %(levelname)s - %(message)s',
+        force=True
+    )
+
+    try:
+        # tenant values win over the shared .env, which modules load later without overriding
+        tenant_env = {}
+        if tenant.get('env_file'):
+            from dotenv import dotenv_values
+            if not os.path.exists(tenant['env_file']):
+                raise FileNotFoundError(f"env_file not found: {tenant['env_file']}")
+            tenant_env.update(dotenv_values(tenant['env_file']))
+        tenant_env.update(tenant.get('env', {}))
+        tenant_env = {key: str(value) for key, value in tenant_env.items() if value not in (None, '')}
+
+        missing = [key for key in REQUIRED_TENANT_KEYS if key not in tenant_env]
+        if missing:
+            raise ValueError(f"Tenant '{name}' is missing required settings: {', '.join(missing)}")
+        os.environ.update(tenant_env)
+
+        # each tenant writes its flagged_orders.csv into its own directory
+        work_dir = os.path.abspath(os.path.join(TENANTS_WORK_DIR, name))
+        os.makedirs(work_dir, exist_ok=True)
+        flagged_orders_csv = os.path.join(work_dir, FLAGGED_ORDERS_CSV)
+
+        import main
+        steps = main.main(flagged_orders_csv)
+        outcome['steps'] = steps
+        outcome['flagged_orders'] = steps['flagged_orders']['flagged']
+        outcome['flip_concurrency'] = main.get_flip_limiter_metrics()
+
+        step_errors = [f"{step}: {result['error']}" for step, result in steps.items() if result['error']]
+        failed_items = sum(result['failed'] for result in steps.values())
+        if step_errors:
+            outcome['error'] = '; '.join(step_errors)
+        elif failed_items:
+            outcome['status'] = 'partial'
+            outcome['error'] = f"{failed_items} item(s) failed"
+        else:
+            outcome['status'] = 'succeeded'
+    except Exception as e:
+        logging.error(f"Pipeline failed for tenant '{name}': {e}")
+        outcome['error'] = f"{type(e).__name__}: {e}"
+        outcome['traceback'] = traceback.format_exc()
+
+    outcome['duration_seconds'] = round(time.monotonic() - started, 3)
+    return outcome
+
+def _run_tenant_in_child(tenant, conn):
+    try:
+        conn.send(run_tenant(tenant))
+    finally:
+        conn.close()
+
+def run_tenant_processes(tenants, workers):
+    """Runs each tenant in its own spawned process, at most `workers` at a time, and returns their outcomes.
+    A fresh interpreter per tenant keeps module-level credentials, the Flip token cache and HTTP
+    connection pools apart, and a worker that dies outright (OOM kill, os._exit, ...) only fails its own tenant."""
+    ctx = multiprocessing.get_context('spawn')
+    pending = list(tenants)
+    running = {} # reader connection -> (tenant name, process, start time)
+    outcomes = []
+
+    while pending or running:
+        while pending and len(running) < workers:
+            tenant = pending.pop(0)
+            reader, writer = ctx.Pipe(duplex=False)
+            process = ctx.Process(target=_run_tenant_in_child, args=(tenant, writer), name=f"tenant-{tenant['name']}")
+            process.start()
+            writer.close() # only the child holds the write end now, so its death shows up as EOF
+            running[reader] = (tenant['name'], process, time.monotonic())
+
+        for reader in multiprocessing.connection.wait(list(running)):
+            name, process, process_started = running.pop(reader)
+            try:
+                outcome = reader.recv()
+            except EOFError:
+                outcome = None
+            reader.close()
+            process.join()
+
+            if outcome is None:
+                outcome = {
+                    'tenant': name,
+                    'pid': process.pid,
+                    'status': 'failed',
+                    'error': f"Worker process died without reporting an outcome (exit code {process.exitcode})",
+                    'duration_seconds': round(time.monotonic() - process_started, 3),
+                }
+            outcomes.append(outcome)
+            logging.info(f"Tenant '{name}' {outcome['status']} in {outcome['duration_seconds']}s")
+
+    return outcomes
+
+def build_report(outcomes, workers, started_at, duration):
+    statuses = [o['status'] for o in outcomes]
+    completed = [o for o in outcomes if 'steps' in o]
+    return {
+        'started_at': started_at,
+        'finished_at': datetime.now().isoformat(timespec='seconds'),
+        'duration_seconds': round(duration, 3),
+        'workers': workers,
+        'totals': {
+            'tenants': len(outcomes),
+            'succeeded': statuses.count('succeeded'),
+            'partial': statuses.count('partial'),
+            'failed': statuses.count('failed'),
+            'flagged_orders': sum(o['flagged_orders'] for o in completed),
+            'tenant_seconds': round(sum(o['duration_seconds'] or 0 for o in outcomes), 3),
+            'flip_calls': sum(o['flip_concurrency']['calls'] for o in completed),
+            'flip_throttled': sum(o['flip_concurrency']['throttled'] for o in completed),
+        },
+        'tenants': sorted(outcomes, key=lambda o: o['tenant']),
+    }
+
+def run_all_tenants(config_path=TENANTS_CONFIG, workers=TENANT_WORKERS):
+    tenants = load_tenants(config_path)
+    if not tenants:
+        logging.warning(f"No tenants configured in {config_path}. Nothing to do.")
+        return None
+
+    workers = max(1, min(workers, len(tenants)))
+    logging.info(f"=== Running pipeline for {len(tenants)} tenants across {workers} worker processes ===")
+
+    started_at = datetime.now().isoformat(timespec='seconds')
+    started = time.monotonic()
+    outcomes = run_tenant_processes(tenants, workers)
+
+    report = build_report(outcomes, workers, started_at, time.monotonic() - started)
+
+    with open(TENANT_REPORT_JSON, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    logging.info(f"Wrote tenant report to {TENANT_REPORT_JSON}")
+
+    totals = report['totals']
+    logging.info(
+        f"=== Tenants: {totals['succeeded']}/{totals['tenants']} succeeded, {totals['partial']} partial, "
+        f"{totals['flagged_orders']} flagged orders, {report['duration_seconds']}s wall / "
+        f"{totals['tenant_seconds']}s tenant time ==="
+    )
+    for outcome in report['tenants']:
+        if outcome['status'] != 'succeeded':
+            logging.error(f"Tenant '{outcome['tenant']}' {outcome['status']}: {outcome['error']}")
+    return report
+
+if __name__ == "__main__":
+    report = run_all_tenants()
+    if report and report['totals']['succeeded'] != report['totals']['tenants']:
+        raise SystemExit(1)
@@ -0,0 +1,78 @@
+import unittest
+from utils.adaptive_limiter import AdaptiveLimiter
+
+def call(limiter, status_code=200, latency=0.0):
+    limiter.acquire()
+    limiter.release(latency, status_code)
+
+def saturated_calls(limiter, count):
+    """Keeps every slot busy like a loaded thread pool: each healthy release is immediately refilled."""
+    def fill():
+        while limiter.get_metrics()['in_flight'] < limiter.limit:
+            limiter.acquire()
+    fill()
+    for _ in range(count):
+        limiter.release(0.0, 200)
+        fill()
+    # drain with a neutral client error so draining doesn't move the limit
+    while limiter.get_metrics()['in_flight']:
+        limiter.release(0.0, 404)
+
+class AdaptiveLimiterTest(unittest.TestCase):
+    def test_grows_by_about_one_per_window_of_healthy_calls(self):
+        limiter = AdaptiveLimiter('test', initial_limit=4, max_limit=16)
+        saturated_calls(limiter, 4)
+        self.assertEqual(limiter.limit, 4) # +1/limit per call lands just short of 5
+        saturated_calls(limiter, 1)
+        self.assertEqual(limiter.limit, 5)
+        self.assertEqual(limiter.get_metrics()['increases'], 1)
+
+    def test_does_not_grow_when_limit_is_not_used(self):
+        limiter = AdaptiveLimiter('test', initial_limit=4, max_limit=16)
+        for _ in range(100):
+            call(limiter)
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(limiter.get_metrics()['increases'], 0)
+
+    def test_cuts_on_throttle_server_error_and_connection_error(self):
+        for status_code in (429, 503, None):
+            limiter = AdaptiveLimiter('test', initial_limit=8, max_limit=16)
+            call(limiter, status_code)
+            self.assertEqual(limiter.limit, 4, status_code)
+
+    def test_cuts_on_slow_success_but_not_on_slow_client_error(self):
+        limiter = AdaptiveLimiter('test', initial_limit=8, latency_target=1.0)
+        call(limiter, 404, latency=2.0)
+        call(limiter, 401, latency=2.0)
+        self.assertEqual(limiter.limit, 8)
+        call(limiter, 200, latency=2.0)
+        self.assertEqual(limiter.limit, 4)
+
+    def test_cuts_once_per_round_trip(self):
+        limiter = AdaptiveLimiter('test', initial_limit=8)
+        for _ in range(5):
+            call(limiter, 429, latency=60.0)
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(limiter.get_metrics()['throttled'], 5)
+        self.assertEqual(limiter.get_metrics()['decreases'], 1)
+
+    def test_stays_within_bounds(self):
+        limiter = AdaptiveLimiter('test', initial_limit=2, min_limit=2, max_limit=3)
+        for _ in range(10):
+            call(limiter, 503)
+        self.assertEqual(limiter.limit, 2)
+        saturated_calls(limiter, 50)
+        self.assertEqual(limiter.limit, 3)
+
+    def test_initial_limit_is_clamped_to_bounds(self):
+        self.assertEqual(AdaptiveLimiter('test', initial_limit=50, max_limit=8).limit, 8)
+        self.assertEqual(AdaptiveLimiter('test', initial_limit=0, min_limit=2).limit, 2)
+
+    def test_rejects_invalid_bounds(self):
+        with self.assertRaises(ValueError):
+            AdaptiveLimiter('test', min_limit=0)
+        with self.assertRaises(ValueError):
+            AdaptiveLimiter('test', min_limit=4, max_limit=2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+import os
+import sys
+import json
+import types
+import shutil
+import tempfile
+import unittest
+import importlib.util
+from unittest import mock
+
+import run_tenants
+from run_tenants import REQUIRED_TENANT_KEYS, load_tenants, run_tenant, build_report
+
+TENANT_ENV = {key: f'{key.lower()}-value' for key in REQUIRED_TENANT_KEYS}
+
+def step(failed=0, error=None, **counts):
+    return {**counts, 'failed': failed, 'error': error}
+
+def pipeline_steps(**overrides):
+    steps = {
+        'flagged_orders': step(fetched=3, flagged=2),
+        'disable_skus': step(skus=2, disabled=2),
+        'cancel_flagged_orders': step(orders=2, cancelled=2, not_found=0),
+        'cancel_soid_orders': step(orders=1, cancelled=1, not_found=0),
+    }
+    steps.update(overrides)
+    return steps
+
+class TenantTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+
+    def write_config(self, tenants):
+        config_path = os.path.join(self.tmp_dir, 'tenants.json')
+        with open(config_path, 'w', encoding='utf-8') as f:
+            json.dump({'tenants': tenants}, f)
+        return config_path
+
+class LoadTenantsTest(TenantTestCase):
+    def test_resolves_env_file_relative_to_config(self):
+        tenants = load_tenants(self.write_config([{'name': 'seller_a', 'env_file': '.env.seller_a'}, {'name': 'seller-b'}]))
+        self.assertEqual(tenants[0]['env_file'], os.path.join(self.tmp_dir, '.env.seller_a'))
+        self.assertNotIn('env_file', tenants[1])
+
+    def test_rejects_names_that_are_not_safe_paths(self):
+        for name in ('../x', 'a/b', 'a b', '.'):
+            with self.assertRaises(ValueError, msg=name):
+                load_tenants(self.write_config([{'name': name}]))
+
+    def test_rejects_missing_and_duplicate_names(self):
+        with self.assertRaises(ValueError):
+            load_tenants(self.write_config([{'env_file': '.env.seller_a'}]))
+        with self.assertRaises(ValueError):
+            load_tenants(self.write_config([{'name': 'seller_a'}, {'name': 'seller_a'}]))
+
+class RunTenantTest(TenantTestCase):
+    def setUp(self):
+        super().setUp()
+        self.main = types.ModuleType('main')
+        self.main.main = mock.Mock(return_value=pipeline_steps())
+        self.main.get_flip_limiter_metrics = mock.Mock(return_value={'calls': 4, 'throttled': 1})
+        for patcher in (
+            mock.patch.dict(sys.modules, {'main': self.main}),
+            mock.patch.dict(os.environ),
+            mock.patch.object(run_tenants, 'TENANTS_WORK_DIR', self.tmp_dir),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_fails_without_running_pipeline_when_required_key_is_missing(self):
+        env = {**TENANT_ENV, 'REFRESH_TOKEN': ''}
+        del env['SOID_LOOK_ID']
+        outcome = run_tenant({'name': 'seller_a', 'env': env})
+        self.assertEqual(outcome['status'], 'failed')
+        self.assertIn('REFRESH_TOKEN', outcome['error'])
+        self.assertIn('SOID_LOOK_ID', outcome['error'])
+        self.main.main.assert_not_called()
+
+    def test_succeeds_and_passes_tenant_csv_path(self):
+        outcome = run_tenant({'name': 'seller_a', 'env': TENANT_ENV})
+        self.assertEqual(outcome['status'], 'succeeded')
+        self.assertEqual(outcome['flagged_orders'], 2)
+        self.assertEqual(outcome['flip_concurrency']['calls'], 4)
+        self.main.main.assert_called_once_with(os.path.join(self.tmp_dir, 'seller_a', 'flagged_orders.csv'))
+        self.assertEqual(os.environ['REFRESH_TOKEN'], TENANT_ENV['REFRESH_TOKEN'])
+
+    def test_partial_when_items_failed(self):
+        self.main.main.return_value = pipeline_steps(disable_skus=step(skus=2, disabled=1, failed=1))
+        outcome = run_tenant({'name': 'seller_a', 'env': TENANT_ENV})
+        self.assertEqual(outcome['status'], 'partial')
+        self.assertIn('1 item(s) failed', outcome['error'])
+
+    def test_failed_when_a_step_errored_but_keeps_step_results(self):
+        self.main.main.return_value = pipeline_steps(cancel_soid_orders=step(orders=0, error='Could not get Flip access token'))
+        outcome = run_tenant({'name': 'seller_a', 'env': TENANT_ENV})
+        self.assertEqual(outcome['status'], 'failed')
+        self.assertIn('cancel_soid_orders: Could not get Flip access token', outcome['error'])
+        self.assertEqual(outcome['steps']['disable_skus']['disabled'], 2)
+
+    def test_failed_when_pipeline_raises(self):
+        self.main.main.side_effect = RuntimeError('boom')
+        outcome = run_tenant({'name': 'seller_a', 'env': TENANT_ENV})
+        self.assertEqual(outcome['status'], 'failed')
+        self.assertEqual(outcome['error'], 'RuntimeError: boom')
+        self.assertNotIn('steps', outcome)
+
+    @unittest.skipIf(importlib.util.find_spec('dotenv') is None, 'python-dotenv is not installed')
+    def test_env_file_values_are_overridden_by_inline_env(self):
+        env_file = os.path.join(self.tmp_dir, '.env.seller_a')
+        with open(env_file, 'w', encoding='utf-8') as f:
+            f.writelines(f'{key}=from-file\n' for key in REQUIRED_TENANT_KEYS)
+        outcome = run_tenant({'name': 'seller_a', 'env_file': env_file, 'env': {'SOID_LOOK_ID': '900'}})
+        self.assertEqual(outcome['status'], 'succeeded')
+        self.assertEqual(os.environ['REFRESH_TOKEN'], 'from-file')
+        self.assertEqual(os.environ['SOID_LOOK_ID'], '900')
+
+class BuildReportTest(unittest.TestCase):
+    def test_totals(self):
+        outcomes = [
+            {'tenant': 'b', 'status': 'partial', 'duration_seconds': 2.0, 'steps': {},
+             'flagged_orders': 3, 'flip_concurrency': {'calls': 10, 'throttled': 2}},
+            {'tenant': 'a', 'status': 'succeeded', 'duration_seconds': 1.5, 'steps': {},
+             'flagged_orders': 1, 'flip_concurrency': {'calls': 5, 'throttled': 0}},
+            {'tenant': 'c', 'status': 'failed', 'duration_seconds': None, 'error': 'died'},
+        ]
+        report = build_report(outcomes, 2, '2026-01-01T00:00:00', 2.5)
+        self.assertEqual(report['totals'], {
+            'tenants': 3,
+            'succeeded': 1,
+            'partial': 1,
+            'failed': 1,
+            'flagged_orders': 4,
+            'tenant_seconds': 3.5,
+            'flip_calls': 15,
+            'flip_throttled': 2,
+        })
+        self.assertEqual([o['tenant'] for o in report['tenants']], ['a', 'b', 'c'])
+
+if __name__ == "__main__":
+    unittest.main()
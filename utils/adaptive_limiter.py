@@ -0,0 +1,156 @@
+import time
+import logging
+import threading
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+class AdaptiveLimiter:
+    """AIMD concurrency limiter. Grows the in-flight limit by ~1 per window of healthy calls made
+    while the limit was fully used, and cuts it multiplicatively on 429/5xx, connection errors
+    or latency above target."""
+
+    def __init__(self, name, initial_limit=4, min_limit=1, max_limit=16,
+                 latency_target=1.0, backoff_ratio=0.5, max_decisions=50):
+        if min_limit < 1:
+            raise ValueError(f"{name}: min_limit must be at least 1, got {min_limit}")
+        if max_limit < min_limit:
+            raise ValueError(f"{name}: max_limit ({max_limit}) must be >= min_limit ({min_limit})")
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.backoff_ratio = backoff_ratio
+        self._limit = float(max(min_limit, min(initial_limit, max_limit)))
+        self._in_flight = 0
+        self._last_decrease = float('-inf')
+        self._cond = threading.Condition()
+        self._decisions = deque(maxlen=max_decisions)
+        self._stats = {
+            'calls': 0,
+            'throttled': 0,
+            'server_errors': 0,
+            'connection_errors': 0,
+            'slow_calls': 0,
+            'increases': 0,
+            'decreases': 0,
+            'total_latency': 0.0,
+            'max_latency': 0.0,
+            'peak_in_flight': 0,
+        }
+
+    @property
+    def limit(self):
+        return int(self._limit)
+
+    def acquire(self):
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+            self._stats['peak_in_flight'] = max(self._stats['peak_in_flight'], self._in_flight)
+
+    def release(self, latency, status_code):
+        with self._cond:
+            # only a call that ran with the limit fully used shows the limit itself is safe
+            saturated = self._in_flight >= int(self._limit)
+            self._in_flight -= 1
+            self._record(latency, status_code, saturated)
+            self._cond.notify_all()
+
+    def slot(self):
+        return _LimiterSlot(self)
+
+    def _record(self, latency, status_code, saturated):
+        stats = self._stats
+        stats['calls'] += 1
+        stats['total_latency'] += latency
+        stats['max_latency'] = max(stats['max_latency'], latency)
+
+        if status_code is None:
+            stats['connection_errors'] += 1
+            reason = 'connection error'
+        elif status_code == 429:
+            stats['throttled'] += 1
+            reason = 'throttled (429)'
+        elif status_code >= 500:
+            stats['server_errors'] += 1
+            reason = f'server error ({status_code})'
+        elif status_code >= 400:
+            return # client errors say nothing about Flip's capacity
+        elif latency > self.latency_target:
+            stats['slow_calls'] += 1
+            reason = f'latency {latency:.2f}s > {self.latency_target:.2f}s'
+        else:
+            reason = None
+
+        if reason:
+            self._decrease(reason, latency)
+        elif saturated:
+            self._increase(latency)
+
+    def _decrease(self, reason, latency):
+        now = time.monotonic()
+        # calls already in flight when we backed off report the same congestion; only cut once per round trip
+        if now - self._last_decrease < latency:
+            return
+        self._last_decrease = now
+        old = self.limit
+        self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+        if self.limit != old:
+            self._decide(old, reason)
+
+    def _increase(self, latency):
+        if self._limit >= self.max_limit:
+            return
+        old = self.limit
+        self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+        if self.limit != old:
+            self._decide(old, f'healthy latency {latency:.2f}s')
+
+    def _decide(self, old, reason):
+        direction = 'increases' if self.limit > old else 'decreases'
+        self._stats[direction] += 1
+        self._decisions.append({
+            'time': round(time.time(), 3),
+            'old_limit': old,
+            'new_limit': self.limit,
+            'reason': reason,
+        })
+        log = logger.info if direction == 'increases' else logger.warning
+        log(f"{self.name} concurrency limit {old} -> {self.limit}: {reason}")
+
+    def get_metrics(self):
+        with self._cond:
+            stats = dict(self._stats)
+            calls = stats.pop('calls')
+            total_latency = stats.pop('total_latency')
+            return {
+                'name': self.name,
+                'limit': self.limit,
+                'min_limit': self.min_limit,
+                'max_limit': self.max_limit,
+                'in_flight': self._in_flight,
+                'calls': calls,
+                'avg_latency': round(total_latency / calls, 3) if calls else 0.0,
+                **{key: round(value, 3) if isinstance(value, float) else value for key, value in stats.items()},
+                'decisions': list(self._decisions),
+            }
+
+class _LimiterSlot:
+    """Context manager holding one in-flight slot. Set status_code once the response arrives;
+    leaving it as None (e.g. on timeout or connection error) counts as a failed call."""
+
+    def __init__(self, limiter):
+        self.limiter = limiter
+        self.status_code = None
+        self._started = None
+
+    def __enter__(self):
+        self.limiter.acquire()
+        self._started = time.monotonic()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.limiter.release(time.monotonic() - self._started, self.status_code)
+        return False
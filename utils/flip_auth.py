@@ -1,6 +1,7 @@
 import os
 import time
 import requests
+import threading
 import logging
 from datetime import datetime
 from dotenv import load_dotenv
@@ -22,6 +23,7 @@ TOKEN_CACHE = {
     'data': None,
     'last_updated': None
 }
+TOKEN_LOCK = threading.Lock() # concurrent Flip calls should trigger a single refresh
 
 def store_token_data(data):
     TOKEN_CACHE['data'] = data
@@ -74,14 +76,15 @@ def refresh_access_token():
         return None
 
 def get_flip_access_token():
-    token_data = load_token_data()
-    
-    if is_token_valid(token_data):
-        logger.info("Using cached access token")
-        return token_data['data']['auth']['accessToken']
-        
-    logger.info("Access token is missing or expired. Refreshing token...")
-    return refresh_access_token()
+    with TOKEN_LOCK:
+        token_data = load_token_data()
+
+        if is_token_valid(token_data):
+            logger.info("Using cached access token")
+            return token_data['data']['auth']['accessToken']
+
+        logger.info("Access token is missing or expired. Refreshing token...")
+        return refresh_access_token()
 
 if __name__ == "__main__":
     token = get_flip_access_token()